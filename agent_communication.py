@@ -1,21 +1,50 @@
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-import re
-from typing import Callable, Dict, List, Optional
+from functools import lru_cache
+import sys
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, Iterable, List, Optional, Sequence, Tuple
 
+if TYPE_CHECKING:
+    from datetime import datetime
 
-ACL_PATTERN = re.compile(
-    r"\(performative\s+(?P<performative>\w+)\s+"
-    r":sender\s+(?P<sender>[\w-]+)\s+"
-    r":receiver\s+(?P<receiver>[\w-]+)\s+"
-    r':content\s+"(?P<content>(?:\\.|[^"\\])*)"\)$'
-)
-ALLOWED_PERFORMATIVES = {"REQUEST", "INFORM"}
 
+REQUEST = sys.intern("REQUEST")
+INFORM = sys.intern("INFORM")
+ALLOWED_PERFORMATIVES = frozenset({REQUEST, INFORM})
+_PERFORMATIVE_ORDER = (REQUEST, INFORM)
 
-@dataclass
+_DEFAULT_START = (2026, 1, 1, 10, 0, 0)
+_UNRESOLVED = object()
+_tokenize_batch: Any = _UNRESOLVED
+
+
+def _is_agent_name(value: str) -> bool:
+    # Same as the [\w-]+ grammar; "" stays falsy because "".isalnum() is False.
+    return value.replace("-", "a").replace("_", "a").isalnum()
+
+
+def _is_escaped_content(escaped: str) -> bool:
+    """Return True if every quote is backslash-escaped and no escape is left open."""
+    if "\\" not in escaped:
+        return '"' not in escaped
+    # Dropping escaped backslashes keeps the remaining escapes aligned, so each
+    # quote must now directly follow a single backslash.
+    unpaired = escaped.replace("\\\\", "")
+    return unpaired.count('"') == unpaired.count('\\"') and not unpaired.endswith("\\")
+
+
+def _unescape(escaped: str) -> str:
+    """Undo serialize() escaping: a backslash keeps the next character literally."""
+    if "\\" not in escaped:
+        return escaped
+    # Splitting on escaped backslashes leaves only single backslashes, each of
+    # which escapes a non-backslash character and can simply be dropped.
+    return "\\".join([part.replace("\\", "") for part in escaped.split("\\\\")])
+
+
+@dataclass(slots=True)
 class ACLMessage:
     """A minimal FIPA-ACL-style message container."""
 
@@ -24,55 +53,228 @@ class ACLMessage:
     receiver: str
     content: str
 
+    def __post_init__(self) -> None:
+        self.performative = self.performative.upper()
+
     def serialize(self) -> str:
         escaped_content = self.content.replace("\\", "\\\\").replace('"', r'\"')
         return (
-            f"(performative {self.performative.upper()} "
+            f"(performative {self.performative} "
             f":sender {self.sender} "
             f":receiver {self.receiver} "
             f':content "{escaped_content}")'
         )
 
+    def _validate(self) -> None:
+        """Raise the error parse() would raise for this message's serialized form."""
+        if (
+            not self.performative
+            or " " in self.performative
+            or not _is_agent_name(self.sender)
+            or not _is_agent_name(self.receiver)
+        ):
+            raise ValueError(f"Invalid ACL message format: {self.serialize()}")
+        if self.performative not in ALLOWED_PERFORMATIVES:
+            raise ValueError(f"Unsupported performative: {self.performative}")
+
     @staticmethod
     def parse(raw_message: str) -> "ACLMessage":
         """Parse a serialized FIPA-ACL-style message."""
-        match = ACL_PATTERN.match(raw_message.strip())
-        if not match:
+        text = raw_message.strip()
+        if not (text.startswith("(performative ") and text.endswith('")')):
             raise ValueError(f"Invalid ACL message format: {raw_message}")
 
-        performative = match.group("performative").upper()
-        if performative not in ALLOWED_PERFORMATIVES:
-            raise ValueError(f"Unsupported performative: {performative}")
+        # Neither the performative nor the agent names may contain spaces, so
+        # the first occurrence of each keyword is the real field boundary.
+        sender_at = text.find(" :sender ", 14)
+        receiver_at = text.find(" :receiver ", sender_at + 9) if sender_at > 14 else -1
+        content_at = text.find(' :content "', receiver_at + 11) if receiver_at != -1 else -1
+        start = content_at + 11
+        end = len(text) - 2
+        if content_at == -1 or start > end:
+            raise ValueError(f"Invalid ACL message format: {raw_message}")
 
-        content = bytes(match.group("content"), "utf-8").decode("unicode_escape")
-        return ACLMessage(
-            performative=performative,
-            sender=match.group("sender"),
-            receiver=match.group("receiver"),
-            content=content,
-        )
+        performative = text[14:sender_at]
+        sender = text[sender_at + 9:receiver_at]
+        receiver = text[receiver_at + 11:content_at]
+        if (
+            " " in performative
+            or not _is_agent_name(sender)
+            or not _is_agent_name(receiver)
+            or not _is_escaped_content(text[start:end])
+        ):
+            raise ValueError(f"Invalid ACL message format: {raw_message}")
+
+        # __post_init__ uppercases the performative, so check it afterwards.
+        message = ACLMessage(performative, sender, receiver, _unescape(text[start:end]))
+        if message.performative not in ALLOWED_PERFORMATIVES:
+            raise ValueError(f"Unsupported performative: {message.performative}")
+        return message
+
+    @staticmethod
+    def parse_many(raw_messages: Sequence[str]) -> List["ACLMessage"]:
+        """Parse a batch of serialized messages, using the Numba tokenizer if installed."""
+        tokenize_batch = _load_tokenize_batch()
+        if tokenize_batch is None:
+            return [ACLMessage.parse(raw_message) for raw_message in raw_messages]
+
+        texts = [raw_message.strip() for raw_message in raw_messages]
+        codes, sender_ends, receiver_ends = tokenize_batch(texts, _PERFORMATIVE_ORDER).T.tolist()
+        messages: List[ACLMessage] = []
+        append = messages.append
+        rows = zip(raw_messages, texts, codes, sender_ends, receiver_ends)
+        for raw_message, text, code, sender_end, receiver_end in rows:
+            if code < 0:
+                # Invalid or non-ASCII messages go through the regular parser,
+                # which also raises the usual detailed error.
+                append(ACLMessage.parse(raw_message))
+                continue
+            performative = _PERFORMATIVE_ORDER[code]
+            append(
+                ACLMessage(
+                    performative,
+                    text[len(performative) + 23:sender_end],  # "(performative P :sender "
+                    text[sender_end + 11:receiver_end],  # " :receiver "
+                    _unescape(text[receiver_end + 11:-2]),  # ' :content "' ... '")'
+                )
+            )
+        return messages
+
+
+def _load_tokenize_batch() -> Any:
+    """Import the optional Numba tokenizer on first use; None when numba is unavailable."""
+    global _tokenize_batch
+    if _tokenize_batch is _UNRESOLVED:
+        try:
+            from agent_communication_fast import tokenize_batch
+        except ImportError:
+            tokenize_batch = None
+        _tokenize_batch = tokenize_batch
+    return _tokenize_batch
 
 
 class EventLogger:
-    """Deterministic logger to make lab outputs reproducible."""
+    """Deterministic logger to make lab outputs reproducible.
+
+    With ``max_entries`` set, only the most recent entries are kept in memory.
+    With ``on_flush`` set, buffered entries are handed to the callback and cleared
+    whenever ``flush_every`` (or ``max_entries``, if smaller) of them accumulate,
+    so no entry is dropped before it is flushed.
+    """
+
+    def __init__(
+        self,
+        start_time: Optional[datetime] = None,
+        max_entries: Optional[int] = None,
+        flush_every: int = 1024,
+        on_flush: Optional[Callable[[Iterable[str]], None]] = None,
+    ):
+        if start_time is None:
+            self._y, self._mo, self._d, self._h, self._mi, self._s = _DEFAULT_START
+            self._microsecond, self._tzinfo = 0, None
+        else:
+            self._y, self._mo, self._d = start_time.year, start_time.month, start_time.day
+            self._h, self._mi, self._s = start_time.hour, start_time.minute, start_time.second
+            self._microsecond, self._tzinfo = start_time.microsecond, start_time.tzinfo
+        if max_entries is not None and max_entries < 1:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+        if flush_every < 1:
+            raise ValueError(f"flush_every must be positive, got {flush_every}")
+
+        self._pending: List[Tuple[str, str]] = []
+        self._entries: Deque[str] = deque(maxlen=max_entries)
+        self._flush_every = flush_every
+        if max_entries is not None and on_flush is not None:
+            self._flush_every = min(flush_every, max_entries)
+        self._on_flush = on_flush
+
+    @property
+    def current(self) -> datetime:
+        """Timestamp that the next added entry will carry."""
+        from datetime import datetime, timedelta
+
+        formatted = datetime(
+            self._y, self._mo, self._d, self._h, self._mi, self._s,
+            self._microsecond, self._tzinfo,
+        )
+        return formatted + timedelta(seconds=len(self._pending))
 
-    def __init__(self, start_time: Optional[datetime] = None):
-        self.entries: List[str] = []
-        self.current = start_time or datetime(2026, 1, 1, 10, 0, 0)
+    @property
+    def entries(self) -> Deque[str]:
+        """Formatted log lines; records are formatted once, on first read."""
+        self._format_pending()
+        return self._entries
 
     def add(self, agent_name: str, event: str) -> None:
-        self.entries.append(f"[{self.current.strftime('%Y-%m-%d %H:%M:%S')}] {agent_name}: {event}")
-        self.current += timedelta(seconds=1)
+        self._pending.append((agent_name, event))
+        if self._on_flush is not None:
+            if len(self._pending) + len(self._entries) >= self._flush_every:
+                self.flush()
+        elif len(self._pending) >= self._flush_every:
+            self._format_pending()
+
+    def flush(self) -> None:
+        """Hand buffered entries to ``on_flush`` and clear them."""
+        self._format_pending()
+        if self._on_flush is not None and self._entries:
+            # Clear only after the callback succeeds so a failed write loses nothing.
+            self._on_flush(list(self._entries))
+            self._entries.clear()
+
+    def _format_pending(self) -> None:
+        if not self._pending:
+            return
+        append = self._entries.append
+        for agent_name, event in self._pending:
+            append(
+                "[%04d-%02d-%02d %02d:%02d:%02d] %s: %s"
+                % (self._y, self._mo, self._d, self._h, self._mi, self._s, agent_name, event)
+            )
+            self._tick()
+        self._pending.clear()
+
+    def _tick(self) -> None:
+        """Advance the clock by one second, carrying into larger fields."""
+        self._s += 1
+        if self._s < 60:
+            return
+        self._s = 0
+        self._mi += 1
+        if self._mi < 60:
+            return
+        self._mi = 0
+        self._h += 1
+        if self._h < 24:
+            return
+        self._h = 0
+        self._d += 1
+        if self._d <= 28:
+            return
+        import calendar
+
+        if self._d <= calendar.monthrange(self._y, self._mo)[1]:
+            return
+        self._d = 1
+        self._mo += 1
+        if self._mo > 12:
+            self._mo = 1
+            self._y += 1
+
+
+@lru_cache(maxsize=64)
+def _no_handler_event(performative: str) -> str:
+    return "No handler for performative: %s" % performative
 
 
 class Agent:
+    _HANDLERS: Dict[str, str] = {
+        REQUEST: "_handle_request",
+        INFORM: "_handle_inform",
+    }
+
     def __init__(self, name: str, logger: EventLogger):
         self.name = name
         self.logger = logger
-        self.handlers: Dict[str, Callable[[ACLMessage], None]] = {
-            "REQUEST": self._handle_request,
-            "INFORM": self._handle_inform,
-        }
 
     def log(self, event: str) -> None:
         self.logger.add(self.name, event)
@@ -82,37 +284,49 @@ class Agent:
             raise ValueError(
                 f"Sender mismatch: message sender '{message.sender}' does not match '{self.name}'"
             )
-        self.log(f"Sent {message.performative.upper()} to {other.name} | {message.content}")
-        other.receive(message.serialize())
+        self.log("Sent %s to %s | %s" % (message.performative, other.name, message.content))
+        try:
+            message._validate()
+        except ValueError as exc:
+            other.log("Rejected malformed ACL message | %s" % exc)
+            return
+        other.deliver(message)
 
     def receive(self, raw_message: str) -> None:
+        """Handle a serialized message, e.g. one arriving from an external transport."""
         try:
             message = ACLMessage.parse(raw_message)
         except ValueError as exc:
-            self.log(f"Rejected malformed ACL message | {exc}")
+            self.log("Rejected malformed ACL message | %s" % exc)
             return
 
+        self.deliver(message)
+
+    def deliver(self, message: ACLMessage) -> None:
+        """Handle an already-parsed message without a serialize/parse round trip."""
         if message.receiver != self.name:
             self.log(
-                f"Ignored message for {message.receiver} from {message.sender} | {message.content}"
+                "Ignored message for %s from %s | %s"
+                % (message.receiver, message.sender, message.content)
             )
             return
 
+        performative = message.performative
         self.log(
-            f"Received {message.performative} from {message.sender} | {message.content}"
+            "Received %s from %s | %s" % (performative, message.sender, message.content)
         )
 
-        handler = self.handlers.get(message.performative)
-        if handler:
-            handler(message)
+        handler_name = self._HANDLERS.get(performative)
+        if handler_name is not None:
+            getattr(self, handler_name)(message)
         else:
-            self.log(f"No handler for performative: {message.performative}")
+            self.log(_no_handler_event(performative))
 
     def _handle_request(self, message: ACLMessage) -> None:
-        self.log(f"Processing REQUEST action: {message.content}")
+        self.log("Processing REQUEST action: %s" % message.content)
 
     def _handle_inform(self, message: ACLMessage) -> None:
-        self.log(f"Acknowledged INFORM update: {message.content}")
+        self.log("Acknowledged INFORM update: %s" % message.content)
 
 
 def run_demo() -> List[str]:
@@ -140,13 +354,17 @@ def run_demo() -> List[str]:
         ),
     )
 
-    return logger.entries
+    return list(logger.entries)
 
 
-def save_logs(path: str = "message_logs.txt", logs: Optional[List[str]] = None) -> None:
+def save_logs(
+    path: str = "message_logs.txt",
+    logs: Optional[Iterable[str]] = None,
+    append: bool = False,
+) -> None:
     logs = logs if logs is not None else run_demo()
-    with open(path, "w", encoding="utf-8") as file:
-        file.write("\n".join(logs) + "\n")
+    with open(path, "a" if append else "w", encoding="utf-8") as file:
+        file.writelines(f"{line}\n" for line in logs)
 
 
 if __name__ == "__main__":
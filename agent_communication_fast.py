@@ -0,0 +1,154 @@
+"""Numba-compiled tokenizer for bulk ACL message ingestion.
+
+This module needs ``numba`` and ``numpy``. Importing it without them raises
+``ImportError``, and ``ACLMessage.parse_many`` then falls back to
+``ACLMessage.parse`` for each message. The compiled pass tokenizes and
+validates a whole batch at once. For each message it reports only what the
+caller needs to slice the fields out of the original string.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+from numba import njit
+
+
+_PERFORMATIVE_KEY = np.frombuffer(b"(performative ", dtype=np.uint8)
+_SENDER_KEY = np.frombuffer(b":sender ", dtype=np.uint8)
+_RECEIVER_KEY = np.frombuffer(b":receiver ", dtype=np.uint8)
+_CONTENT_KEY = np.frombuffer(b':content "', dtype=np.uint8)
+
+_SPACE = 32
+_QUOTE = 34
+_BACKSLASH = 92
+_CLOSE_PAREN = 41
+_HYPHEN = 45
+_UNDERSCORE = 95
+
+
+@njit(cache=True)
+def _starts_with(buf, pos, end, keyword):
+    if pos + keyword.shape[0] > end:
+        return False
+    for i in range(keyword.shape[0]):
+        if buf[pos + i] != keyword[i]:
+            return False
+    return True
+
+
+@njit(cache=True)
+def _is_name_byte(byte):
+    return (
+        (48 <= byte <= 57)
+        or (65 <= byte <= 90)
+        or (97 <= byte <= 122)
+        or byte == _HYPHEN
+        or byte == _UNDERSCORE
+    )
+
+
+@njit(cache=True)
+def _read_name(buf, pos, end, keyword):
+    """Return the end of the ASCII agent name after ``keyword``, or -1."""
+    if not _starts_with(buf, pos, end, keyword):
+        return -1
+    start = pos + keyword.shape[0]
+    i = start
+    while i < end and _is_name_byte(buf[i]):
+        i += 1
+    if i == start or i >= end or buf[i] != _SPACE:
+        return -1
+    return i
+
+
+@njit(cache=True)
+def _match_performative(buf, start, stop, performatives):
+    """Return the index of the case-insensitively matching performative, or -1."""
+    for code in range(len(performatives)):
+        name = performatives[code]
+        if name.shape[0] != stop - start:
+            continue
+        matched = True
+        for i in range(name.shape[0]):
+            byte = buf[start + i]
+            if 97 <= byte <= 122:
+                byte -= 32
+            if byte != name[i]:
+                matched = False
+                break
+        if matched:
+            return code
+    return -1
+
+
+@njit(cache=True)
+def _tokenize_one(buf, pos, end, performatives, tokens, row):
+    """Fill ``tokens[row]``; return False if the fast path cannot accept the message."""
+    if end - pos < 2 or buf[end - 1] != _CLOSE_PAREN:
+        return False
+    if not _starts_with(buf, pos, end, _PERFORMATIVE_KEY):
+        return False
+    start = pos + _PERFORMATIVE_KEY.shape[0]
+    stop = start
+    while stop < end and buf[stop] != _SPACE:
+        stop += 1
+    code = _match_performative(buf, start, stop, performatives)
+    if code < 0 or stop >= end:
+        return False
+
+    sender_end = _read_name(buf, stop + 1, end, _SENDER_KEY)
+    if sender_end < 0:
+        return False
+    receiver_end = _read_name(buf, sender_end + 1, end, _RECEIVER_KEY)
+    if receiver_end < 0 or not _starts_with(buf, receiver_end + 1, end, _CONTENT_KEY):
+        return False
+
+    i = receiver_end + 1 + _CONTENT_KEY.shape[0]
+    while i < end:
+        byte = buf[i]
+        if byte == _BACKSLASH:
+            i += 2
+        elif byte == _QUOTE:
+            break
+        else:
+            i += 1
+    if i != end - 2:
+        return False
+    tokens[row, 0] = code
+    tokens[row, 1] = sender_end - pos
+    tokens[row, 2] = receiver_end - pos
+    return True
+
+
+@njit(cache=True)
+def _tokenize_batch(buf, offsets, performatives):
+    count = offsets.shape[0] - 1
+    tokens = np.full((count, 3), -1, dtype=np.int64)
+    for row in range(count):
+        _tokenize_one(buf, offsets[row], offsets[row + 1], performatives, tokens, row)
+    return tokens
+
+
+def tokenize_batch(texts: Sequence[str], performatives: Sequence[str]) -> np.ndarray:
+    """Tokenize and validate stripped ACL strings in one compiled pass.
+
+    Returns an ``(n, 3)`` array. Each row holds the index of the message's
+    performative in ``performatives`` and the end offsets of the sender and
+    receiver names within that message. Everything before the content is ASCII
+    on this path, so byte and character offsets agree. The remaining fields
+    follow from the fixed keywords. A row of -1 was not accepted. Such a
+    message is either invalid or outside the ASCII fast path, and the caller
+    should parse it individually.
+    """
+    offsets = np.zeros(len(texts) + 1, dtype=np.int64)
+    np.cumsum(
+        [len(text) if text.isascii() else len(text.encode("utf-8")) for text in texts],
+        out=offsets[1:],
+    )
+    names = tuple(
+        np.frombuffer(name.upper().encode("ascii"), dtype=np.uint8) for name in performatives
+    )
+    buf = np.frombuffer("".join(texts).encode("utf-8"), dtype=np.uint8)
+    return _tokenize_batch(buf, offsets, names)
@@ -1,6 +1,16 @@
+import importlib.util
+import os
+import pickle
+import tempfile
 import unittest
+from dataclasses import replace
+from datetime import datetime
+from functools import partial
+from typing import List
 
-from agent_communication import ACLMessage, Agent, EventLogger, run_demo
+from agent_communication import ACLMessage, Agent, EventLogger, run_demo, save_logs
+
+HAS_NUMBA = importlib.util.find_spec("numba") is not None
 
 
 class TestACLMessage(unittest.TestCase):
@@ -18,6 +28,47 @@ class TestACLMessage(unittest.TestCase):
         self.assertEqual(parsed.receiver, "WorkerAgent")
         self.assertEqual(parsed.content, 'Run task "A" with path C:\\temp')
 
+    def test_round_trip_preserves_non_ascii_content(self) -> None:
+        message = ACLMessage(
+            performative="INFORM",
+            sender="WorkerAgent",
+            receiver="PlannerAgent",
+            content='Zone Ä avg=24.3°C \\"done\\"',
+        )
+        parsed = ACLMessage.parse(message.serialize())
+
+        self.assertEqual(parsed.content, message.content)
+
+    def test_performative_is_normalized_on_construction(self) -> None:
+        message = ACLMessage("inform", "WorkerAgent", "PlannerAgent", "done")
+
+        self.assertEqual(message.performative, "INFORM")
+
+    def test_messages_are_slotted_and_picklable(self) -> None:
+        message = ACLMessage("INFORM", "WorkerAgent", "PlannerAgent", "done")
+
+        self.assertFalse(hasattr(message, "__dict__"))
+        self.assertEqual(pickle.loads(pickle.dumps(message)), message)
+        self.assertEqual(replace(message, content="redo").content, "redo")
+
+    def test_round_trip_large_escaped_payload(self) -> None:
+        for content in ("\\" * 200_000, '\\"' * 100_000):
+            message = ACLMessage("INFORM", "WorkerAgent", "PlannerAgent", content)
+
+            self.assertEqual(ACLMessage.parse(message.serialize()).content, content)
+
+    def test_parse_many_matches_parse(self) -> None:
+        raws = [
+            ACLMessage("REQUEST", "PlannerAgent", "WorkerAgent", 'Run "A"').serialize(),
+            ACLMessage("INFORM", "WorkerAgent", "PlannerAgent", "C:\\temp").serialize(),
+        ]
+
+        self.assertEqual(ACLMessage.parse_many(raws), [ACLMessage.parse(raw) for raw in raws])
+
+    def test_parse_many_rejects_invalid_message(self) -> None:
+        with self.assertRaises(ValueError):
+            ACLMessage.parse_many(["invalid format"])
+
     def test_parse_invalid_message_raises(self) -> None:
         with self.assertRaises(ValueError):
             ACLMessage.parse("invalid format")
@@ -28,6 +79,39 @@ class TestACLMessage(unittest.TestCase):
             ACLMessage.parse(raw)
 
 
+@unittest.skipUnless(HAS_NUMBA, "numba is not installed")
+class TestFastTokenizer(unittest.TestCase):
+    def test_tokenize_batch_reports_performative_and_name_ends(self) -> None:
+        from agent_communication_fast import tokenize_batch
+
+        raw = ACLMessage("inform", "WorkerAgent", "Planner-1", 'Zone Ä "done"').serialize()
+        tokens = tokenize_batch([raw], ("REQUEST", "INFORM")).tolist()
+
+        self.assertEqual(tokens, [[1, raw.index(" :receiver"), raw.index(" :content")]])
+
+    def test_tokenize_batch_rejects_what_the_fast_path_cannot_handle(self) -> None:
+        from agent_communication_fast import tokenize_batch
+
+        raws = [
+            "not acl",
+            '(performative PROPOSE :sender A1 :receiver A2 :content "hello")',
+            '(performative REQUEST :sender Ägent :receiver A2 :content "hello")',
+            '(performative REQUEST :sender A1 :receiver A2 :content "a"b")',
+            '(performative REQUEST :sender A1 :receiver A2 :content "hello\\")',
+        ]
+        tokens = tokenize_batch(raws, ("REQUEST", "INFORM")).tolist()
+
+        self.assertEqual(tokens, [[-1, -1, -1]] * len(raws))
+
+    def test_parse_many_uses_fast_path_for_valid_messages(self) -> None:
+        raws = [
+            ACLMessage("REQUEST", "PlannerAgent", "WorkerAgent", "C:\\temp").serialize(),
+            '(performative REQUEST :sender Ägent :receiver A2 :content "hello")',
+        ]
+
+        self.assertEqual(ACLMessage.parse_many(raws), [ACLMessage.parse(raw) for raw in raws])
+
+
 class TestAgentCommunication(unittest.TestCase):
     def test_request_and_inform_actions_are_logged(self) -> None:
         logs = run_demo()
@@ -51,6 +135,58 @@ class TestAgentCommunication(unittest.TestCase):
             any("Ignored message for OtherAgent" in entry for entry in logger.entries)
         )
 
+    def test_deliver_dispatches_parsed_message(self) -> None:
+        logger = EventLogger()
+        agent = Agent("WorkerAgent", logger)
+        agent.deliver(
+            ACLMessage(
+                performative="REQUEST",
+                sender="PlannerAgent",
+                receiver="WorkerAgent",
+                content="Collect readings",
+            )
+        )
+
+        self.assertEqual(
+            [entry[22:] for entry in logger.entries],
+            [
+                "WorkerAgent: Received REQUEST from PlannerAgent | Collect readings",
+                "WorkerAgent: Processing REQUEST action: Collect readings",
+            ],
+        )
+
+    def test_unhandled_performative_is_logged(self) -> None:
+        logger = EventLogger()
+        agent = Agent("WorkerAgent", logger)
+        message = ACLMessage("PROPOSE", "PlannerAgent", "WorkerAgent", "Swap zones")
+        agent.deliver(message)
+        agent.deliver(message)
+
+        self.assertEqual(
+            [entry for entry in logger.entries if "No handler" in entry],
+            [
+                "[2026-01-01 10:00:01] WorkerAgent: No handler for performative: PROPOSE",
+                "[2026-01-01 10:00:03] WorkerAgent: No handler for performative: PROPOSE",
+            ],
+        )
+
+    def test_send_rejects_messages_parse_would_reject(self) -> None:
+        logger = EventLogger()
+        planner = Agent("PlannerAgent", logger)
+        worker = Agent("WorkerAgent", logger)
+        planner.send(worker, ACLMessage("PROPOSE", "PlannerAgent", "WorkerAgent", "Swap zones"))
+        planner.send(worker, ACLMessage("REQUEST", "PlannerAgent", "Worker Agent", "Go"))
+
+        self.assertEqual(
+            [entry[22:] for entry in logger.entries if "WorkerAgent:" in entry],
+            [
+                "WorkerAgent: Rejected malformed ACL message | "
+                "Unsupported performative: PROPOSE",
+                "WorkerAgent: Rejected malformed ACL message | Invalid ACL message format: "
+                '(performative REQUEST :sender PlannerAgent :receiver Worker Agent :content "Go")',
+            ],
+        )
+
     def test_malformed_message_is_rejected(self) -> None:
         logger = EventLogger()
         agent = Agent("WorkerAgent", logger)
@@ -66,5 +202,105 @@ class TestAgentCommunication(unittest.TestCase):
         self.assertEqual(logs[-1][:21], "[2026-01-01 10:00:05]")
 
 
+class TestEventLogger(unittest.TestCase):
+    def test_entries_are_stable_across_interleaved_reads(self) -> None:
+        logger = EventLogger()
+        logger.add("PlannerAgent", "first")
+        first_read = list(logger.entries)
+        logger.add("WorkerAgent", "second")
+
+        self.assertEqual(list(logger.entries)[:1], first_read)
+        self.assertEqual(
+            list(logger.entries),
+            [
+                "[2026-01-01 10:00:00] PlannerAgent: first",
+                "[2026-01-01 10:00:01] WorkerAgent: second",
+            ],
+        )
+
+    def test_timestamps_carry_across_year_boundary(self) -> None:
+        logger = EventLogger(datetime(2024, 12, 31, 23, 59, 59))
+        logger.add("PlannerAgent", "before")
+        logger.add("PlannerAgent", "after")
+
+        self.assertEqual(logger.entries[0][:21], "[2024-12-31 23:59:59]")
+        self.assertEqual(logger.entries[1][:21], "[2025-01-01 00:00:00]")
+        self.assertEqual(logger.current, datetime(2025, 1, 1, 0, 0, 1))
+
+    def test_max_entries_keeps_most_recent_lines(self) -> None:
+        logger = EventLogger(max_entries=2)
+        for index in range(5):
+            logger.add("PlannerAgent", f"event {index}")
+
+        self.assertEqual(
+            list(logger.entries),
+            [
+                "[2026-01-01 10:00:03] PlannerAgent: event 3",
+                "[2026-01-01 10:00:04] PlannerAgent: event 4",
+            ],
+        )
+
+    def test_flush_every_hands_batches_to_callback(self) -> None:
+        batches: List[List[str]] = []
+        logger = EventLogger(flush_every=2, on_flush=batches.append)
+        for index in range(5):
+            logger.add("PlannerAgent", f"event {index}")
+
+        self.assertEqual([len(batch) for batch in batches], [2, 2])
+        self.assertEqual(list(logger.entries), ["[2026-01-01 10:00:04] PlannerAgent: event 4"])
+
+        logger.flush()
+        self.assertEqual(batches[-1], ["[2026-01-01 10:00:04] PlannerAgent: event 4"])
+        self.assertEqual(len(logger.entries), 0)
+
+    def test_failed_flush_keeps_entries(self) -> None:
+        def fail(lines: List[str]) -> None:
+            raise OSError("disk full")
+
+        logger = EventLogger(flush_every=10, on_flush=fail)
+        logger.add("PlannerAgent", "event 0")
+        with self.assertRaises(OSError):
+            logger.flush()
+
+        self.assertEqual(list(logger.entries), ["[2026-01-01 10:00:00] PlannerAgent: event 0"])
+
+    def test_flush_happens_before_max_entries_drops_lines(self) -> None:
+        batches: List[List[str]] = []
+        logger = EventLogger(max_entries=2, flush_every=4, on_flush=batches.append)
+        for index in range(4):
+            logger.add("PlannerAgent", f"event {index}")
+
+        self.assertEqual(
+            [line[-7:] for batch in batches for line in batch],
+            ["event 0", "event 1", "event 2", "event 3"],
+        )
+
+    def test_flush_counts_entries_already_read(self) -> None:
+        batches: List[List[str]] = []
+        logger = EventLogger(flush_every=3, on_flush=batches.append)
+        for index in range(10):
+            logger.add("PlannerAgent", f"event {index}")
+            logger.entries
+
+        self.assertEqual([len(batch) for batch in batches], [3, 3, 3])
+        self.assertEqual(len(logger.entries), 1)
+
+    def test_save_logs_appends_flushed_batches(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "logs.txt")
+            logger = EventLogger(flush_every=2, on_flush=partial(save_logs, path, append=True))
+            for index in range(5):
+                logger.add("PlannerAgent", f"event {index}")
+            logger.flush()
+
+            with open(path, encoding="utf-8") as file:
+                lines = file.read().splitlines()
+
+        self.assertEqual(
+            lines,
+            ["[2026-01-01 10:00:0%d] PlannerAgent: event %d" % (index, index) for index in range(5)],
+        )
+
+
 if __name__ == "__main__":
     unittest.main()